@@ -2,10 +2,18 @@
 """
 nettop-notch — interactive macOS nettop rate viewer (Δ/Σ KB/s per process)
 """
-import argparse, csv, shutil, subprocess, time, sys, os
-from datetime import datetime
+import argparse, codecs, csv, heapq, math, queue, select, shutil, subprocess, threading, time, sys, os
+import unicodedata
+from collections import namedtuple
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from . import __version__
 
+try:
+    import curses
+except ImportError:   # Python built without _curses: non-UI mode only
+    curses = None
+
 # =========================
 # Config / Defaults
 # =========================
@@ -13,6 +21,16 @@ DEFAULT_INTERVAL = 3.0
 DEFAULT_TOP = 20
 DEFAULT_THRESHOLD_KBS = 500.0  # KB/s (highlight threshold; 0 disables)
 NUMW = 11  # width for numeric columns
+SAMPLE_POLL = 0.2  # s per select() slice on the nettop pipe (also the stop latency)
+SAMPLE_GAP = 0.5   # fraction of nettop's delay the pipe must stay silent to end a sample
+POLL_FAST_MS = 20   # UI key poll slice right after a key press ...
+POLL_IDLE_MS = 200  # ... and otherwise, while waiting for the next sample
+KEY_ACTIVE_S = 1.0  # how long after a key press polling stays fast
+
+# Table line templates, built once: three numeric columns, then
+# PROCESS / IFACE(S) / STATE / CONNECTION.
+HEADER_FMT = "%%%ds  %%%ds  %%%ds   %%-30s  %%-12s  %%-12s  %%s" % (NUMW, NUMW, NUMW)
+LINE_FMT   = "%%%d.1f  %%%d.1f  %%%d.1f   %%-30s  %%-12s  %%-12s  %%s" % (NUMW, NUMW, NUMW)
 
 # ANSI (used only in non-UI mode)
 RESET = "\033[0m"; BOLD = "\033[1m"; GREEN = "\033[92m"; HILITE = GREEN + BOLD
@@ -33,86 +51,270 @@ def _ensure_macos_or_exit():
 # =========================
 # nettop plumbing
 # =========================
-def build_nettop_cmd(nettop_args):
+def build_nettop_cmd(nettop_args, interval=DEFAULT_INTERVAL):
     cmd = ["nettop"]
     if nettop_args: cmd += nettop_args
     flat = " ".join(cmd).lower()
     if "-n" not in flat.split(): cmd += ["-n"]             # no DNS
     if "-x" not in flat.split(): cmd += ["-x"]             # CSV
-    if "-l" not in flat and "-L" not in flat: cmd += ["-L","1"]  # one sample per call
+    if "-l" not in flat and "-L" not in flat: cmd += ["-L","0"]  # keep sampling until we quit
+    if "-s" not in flat.split(): cmd += ["-s", str(effective_interval(None, interval))]
     return cmd
 
-def run_csv(cmd):
-    try:
-        out = subprocess.check_output(cmd, text=True)
-    except subprocess.CalledProcessError:
-        return [], []
-    except Exception:
-        return [], []
-    rows = list(csv.reader(out.splitlines()))
-    if not rows: return [], []
-    header = rows[0]
-    if len(header)>1 and (header[1]=="" or header[1].lower()=="process"):
-        header[1] = "process"
-    return header, rows[1:]
+def effective_interval(nettop_args, interval):
+    """
+    The interval nettop will actually sample at. Its delay (-s) is whole
+    seconds, so `interval` is rounded up (sub-second values become 1s); a
+    user-supplied -s in nettop_args wins over `interval`.
+    """
+    args = [a.lower() for a in nettop_args or ()]
+    if "-s" in args:
+        try:
+            return max(1, int(args[args.index("-s") + 1]))
+        except (IndexError, ValueError):
+            pass
+    return max(1, math.ceil(interval))
 
-def parse_snapshot(cmd):
+def parse_snapshot(lines):
     """
+    Parses one nettop CSV sample (header line first).
     Returns:
       proc_totals: dict proc -> (bytes_in, bytes_out)
       proc_conns:  dict proc -> list of {'iface','state','local','remote'}
     """
-    header, body = run_csv(cmd)
+    # csv.reader is the C-coded _csv parser; rows are consumed lazily
+    body = csv.reader(lines)
+    header = next(body, None)
     if not header: return {}, {}
+    if len(header)>1 and (header[1]=="" or header[1].lower()=="process"):
+        header[1] = "process"
     idx = {name.lower(): i for i,name in enumerate(header)}
-    col_iface = idx.get("interface")
-    col_state = idx.get("state")
-    col_in    = idx.get("bytes_in")
-    col_out   = idx.get("bytes_out")
+    cols = [idx.get(name) for name in ("interface", "state", "bytes_in", "bytes_out")]
+    # One itemgetter call fetches every cell we need; short rows are padded
+    # up to `width`, and a column missing from the header reads the "" that
+    # gets appended to each row.
+    missing = None in cols
+    get_cells = itemgetter(1, *(-1 if c is None else c for c in cols))
+    width = max([1] + [c for c in cols if c is not None]) + 1
+    filler = [""] * width
 
     proc_totals, proc_conns = {}, {}
-    cur_proc = None
+    conns_setdefault = proc_conns.setdefault
+    # interface and state names come from a small fixed set and repeat every
+    # sample; interning makes later dict lookups and comparisons identity
+    # hits. Process cells (name.pid) are unbounded, and interned strings are
+    # immortal on CPython 3.12, so those are left alone.
+    intern = sys.intern
+    cur_conns = None
 
     for r in body:
-        cell1 = r[1].strip() if len(r)>1 else ""
-        iface = r[col_iface].strip() if col_iface is not None and col_iface < len(r) else ""
-        state = r[col_state].strip() if col_state is not None and col_state < len(r) else ""
+        if len(r) < width: r += filler[len(r):]
+        if missing: r.append("")
+        cell1, iface, state, bin_s, bout_s = get_cells(r)
+        cell1 = cell1.strip()
 
+        # plain substring test first: measured faster than a compiled regex or a prefix-set probe
         is_conn = "<->" in cell1 or cell1.startswith(("tcp","udp"))
         if is_conn:
-            if cur_proc:
-                parts = cell1.split("<->", 1)
-                local = parts[0].strip() if parts else ""
-                remote = parts[1].strip() if len(parts) > 1 else ""
-                proc_conns.setdefault(cur_proc, []).append({
-                    "iface": (iface or "-"), "state": (state or "-"),
-                    "local": local, "remote": remote
+            if cur_conns is not None:
+                local, _, remote = cell1.partition("<->")
+                cur_conns.append({
+                    "iface": intern(iface.strip() or "-"), "state": intern(state.strip() or "-"),
+                    "local": local.strip(), "remote": remote.strip()
                 })
             continue
 
+        if not cell1: continue
         proc = cell1
-        if not proc: continue
-        cur_proc = proc
-        try:
-            bin_  = int(r[col_in])  if col_in  is not None and r[col_in]  else 0
-            bout_ = int(r[col_out]) if col_out is not None and r[col_out] else 0
-        except Exception:
-            bin_, bout_ = 0, 0
+        # isdecimal, not isdigit: "²" is a digit but int() rejects it
+        bin_  = int(bin_s)  if bin_s.isdecimal()  else 0
+        bout_ = int(bout_s) if bout_s.isdecimal() else 0
         proc_totals[proc] = (bin_, bout_)
-        proc_conns.setdefault(proc, [])
+        cur_conns = conns_setdefault(proc, [])
 
     return proc_totals, proc_conns
 
+def sample_blocks(fd, stop=None, idle=None):
+    """
+    Yields one list of CSV lines (header first) per nettop sample, read off
+    the pipe with os.read and split by hand. A sample ends when nettop
+    repeats its header (it prints one at the top of every sample), or, if
+    `idle` is given, once the pipe has been quiet for `idle` seconds after a
+    complete line. Pass a good fraction of nettop's delay there, so a stall
+    mid-sample does not split it; without it the last sample waits for the
+    next header.
+    Returns at EOF, or within SAMPLE_POLL once `stop` (an Event) is set.
+    """
+    decode = codecs.getincrementaldecoder("utf-8")(errors="replace").decode
+    header, rows, tail = None, [], ""
+    last_read = time.monotonic()
+    while True:
+        if not select.select([fd], [], [], SAMPLE_POLL)[0]:
+            if stop is not None and stop.is_set(): return
+            if idle is not None and rows and not tail and time.monotonic() - last_read >= idle:
+                yield [header] + rows
+                rows = []
+            continue
+        chunk = os.read(fd, 65536)
+        if not chunk: break
+        last_read = time.monotonic()
+        lines = (tail + decode(chunk)).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            if not line: continue
+            if header is None:
+                header = line
+            elif line == header:
+                if rows:
+                    yield [header] + rows
+                    rows = []
+            else:
+                rows.append(line)
+    if tail and header is not None and tail != header: rows.append(tail)
+    if rows: yield [header] + rows
+
+def snapshots(cmd, stop=None, idle=None):
+    """
+    Yields (proc_totals, proc_conns) for each sample of one long-lived nettop,
+    until nettop exits or `stop` is set. nettop is terminated and reaped, and
+    its pipe closed, on the way out. `idle` is passed on to sample_blocks.
+    """
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, bufsize=0)
+    except Exception:
+        return
+    with proc:   # closes the pipe and waits on the way out
+        try:
+            for block in sample_blocks(proc.stdout.fileno(), stop, idle):
+                yield parse_snapshot(block)
+        finally:
+            proc.terminate()
+
+class Sampler:
+    """
+    Reads nettop on a daemon thread so the UI never waits on it. Only the
+    newest sample is kept: `queue` holds at most one (time, totals, conns).
+    If nettop exits (e.g. a user-supplied -L N ran out) it is respawned, at
+    most once per `interval`. An exception on the thread ends it; get()
+    re-raises it in the consumer.
+    """
+    def __init__(self, cmd, interval):
+        self.cmd = cmd
+        self.interval = interval
+        self.queue = queue.Queue(maxsize=1)
+        self.error = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="nettop-sampler", daemon=True)
+        self._thread.start()
+
+    def get(self, block=True, timeout=None):
+        """Next (time, totals, conns); raises queue.Empty like Queue.get, or the thread's error."""
+        item = self.queue.get(block, timeout)
+        if item is None:
+            raise self.error
+        return item
+
+    def _publish(self, item):
+        try:
+            self.queue.get_nowait()   # drop the sample nobody picked up
+        except queue.Empty:
+            pass
+        self.queue.put(item)
+
+    def _run(self):
+        try:
+            while not self._stop.is_set():
+                started = time.monotonic()
+                for totals, conns in snapshots(self.cmd, self._stop, SAMPLE_GAP * self.interval):
+                    self._publish((time.monotonic(), totals, conns))
+                self._stop.wait(max(0.0, started + self.interval - time.monotonic()))
+        except Exception as e:
+            self.error = e
+            self._publish(None)
+
+    def close(self):
+        self._stop.set()
+        self._thread.join(timeout=2 * SAMPLE_POLL)
+
 # =========================
 # helpers / formatting
 # =========================
-def kbs_num(n_bytes_per_sec):
-    return f"{(n_bytes_per_sec/1024.0):{NUMW}.1f}"
+def table_header(metric_hdr):
+    return HEADER_FMT % ("IN KB/s", "OUT KB/s", metric_hdr, "PROCESS", "IFACE(S)", "STATE", "CONNECTION")
+
+def table_line(rin, rout, metric_val, proc, iface, state, conn_str):
+    """One table row; rates are bytes/sec, shown as KB/s."""
+    return LINE_FMT % (rin/1024.0, rout/1024.0, metric_val/1024.0, proc, iface, state, conn_str)
 
 def clear():
     print("\033[H\033[J", end="")
 
+def fit_cells(text, width):
+    """
+    `text` cut or padded to exactly `width` screen cells, counting East Asian
+    wide/fullwidth characters as two cells and combining marks as none.
+    """
+    if text.isascii():
+        return text[:width].ljust(width)
+    out, used = [], 0
+    for ch in text:
+        if unicodedata.combining(ch):
+            w = 0
+        else:
+            w = 2 if unicodedata.east_asian_width(ch) in "WF" else 1
+        if used + w > width: break
+        out.append(ch); used += w
+    return "".join(out) + " " * (width - used)
+
+def frame_updates(frame, last_frame, nrows):
+    """
+    Screen rows draw() must touch to turn `last_frame` into `frame` (both
+    lists of (text, attr)). Returns (rewrite, blank): rows of `frame` to
+    rewrite, and rows below it to clear.
+    A row is rewritten when it changed, or when the row above it was
+    rewritten with non-ASCII text: fit_cells() goes by East Asian width,
+    which not every terminal agrees with, so such a row may still have
+    spilled into the next one.
+    """
+    rewrite, spill = [], False
+    n_last = len(last_frame)
+    for y, row in enumerate(frame):
+        if spill or y >= n_last or last_frame[y] != row:
+            rewrite.append(y)
+            spill = not row[0].isascii()
+        else:
+            spill = False
+    end = min(max(n_last, len(frame) + spill), nrows)
+    return rewrite, list(range(len(frame), end))
+
+def title_template(args):
+    """Title line with everything but the timestamp filled in; finish with `% timestamp()`."""
+    return (" nettop rates watch  [%%s]  interval=%ds  group=%s  threshold=%.1f KB/s"
+            % (args.interval, args.group, args.threshold))
+
+def timestamp():
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
 # ---------- Interface prioritization ----------
+IFACE_PLACEHOLDERS = frozenset({"-"})
+IFACE_LOOPBACKS = frozenset({"lo", "lo0"})
+IFACE_PREFIX_SCORES = {
+    "en": 100,      # Ethernet/Wi-Fi
+    "pdp_ip": 90,
+    "utun": 80,     # VPN
+    "awdl": 40,
+}
+_IFACE_PREFIXES = tuple(IFACE_PREFIX_SCORES)
+
+def iface_score(i: str) -> int:
+    if i in IFACE_PLACEHOLDERS: return -100
+    n = i.lower()
+    if n.startswith(_IFACE_PREFIXES):
+        for prefix, score in IFACE_PREFIX_SCORES.items():
+            if n.startswith(prefix): return score
+    if n in IFACE_LOOPBACKS: return -10
+    return 50
+
 def summarize_ifaces(conns):
     """
     Returns (primary_iface, extra_count, state_for_primary).
@@ -121,54 +323,73 @@ def summarize_ifaces(conns):
     """
     if not conns:
         return "-", 0, "-"
+    # Ordered, de-duplicated (iface, state) pairs: the (cached) summary only
+    # depends on these, and they rarely change between ticks.
+    sig = tuple(dict.fromkeys(((c.get("iface") or "-"), c.get("state","-")) for c in conns))
+    return _summarize_sig(sig)
 
-    seen = {}
-    for c in conns:
-        i = (c.get("iface") or "-")
-        if i not in seen:
-            seen[i] = None
-    uniq = list(seen.keys())
-
-    placeholder = {"-"}
-    loopbacks = {"lo", "lo0"}
-    real_ifaces = [i for i in uniq if i not in placeholder]
-    externals   = [i for i in real_ifaces if i not in loopbacks]
-
-    def score(i: str) -> int:
-        if i in placeholder: return -100
-        n = i.lower()
-        if n.startswith("en"):      return 100   # Ethernet/Wi-Fi
-        if n.startswith("pdp_ip"):  return 90
-        if n.startswith("utun"):    return 80    # VPN
-        if n.startswith("awdl"):    return 40
-        if n in loopbacks:          return -10
-        return 50
+@lru_cache(maxsize=4096)
+def _summarize_sig(sig):
+    uniq = dict.fromkeys(i for i, _ in sig)   # ordered, unique interfaces
+
+    real_ifaces = [i for i in uniq if i not in IFACE_PLACEHOLDERS]
+    externals   = [i for i in real_ifaces if i not in IFACE_LOOPBACKS]
 
     candidates = externals or real_ifaces or ["-"]
-    primary = max(candidates, key=lambda i: (score(i), i))
-    extra_real = len(set(real_ifaces)) - 1 if real_ifaces else 0
+    primary = max(candidates, key=lambda i: (iface_score(i), i))
+    extra_real = len(real_ifaces) - 1 if real_ifaces else 0   # already unique
 
-    state = next((c.get("state","-") for c in conns if (c.get("iface") or "-") == primary),
-                 conns[0].get("state","-"))
+    state = next((st for i, st in sig if i == primary), sig[0][1])
     return primary, max(0, extra_real), state
 
 # =========================
 # rows building (metrics, with dt)
 # =========================
+# One display row. Process rows carry the process's `conns`; remote-grouped
+# rows carry `remote` plus the `locals` list of sockets folded into them.
+# The CONNECTION text is only built (format_conn) for rows that get shown.
+Row = namedtuple("Row", "proc iface state rin rout rsum rdelta conns remote locals",
+                 defaults=((), "", ()))
+
+def format_conn(e):
+    """CONNECTION column for a Row."""
+    if e.locals:   # remote-grouped row
+        first_local = e.locals[0]
+        extra = f" [+{len(e.locals)-1}]" if len(e.locals) > 1 else ""
+        return (first_local + "<->" if first_local else "") + e.remote + extra
+    remotes = [c["remote"] for c in e.conns if c["remote"]]
+    sockets = len(e.conns)
+    distinct_remotes = len(set(remotes))
+    first_remote = remotes[0] if remotes else "(no remote)"
+    extra = ""
+    if distinct_remotes > 1 or sockets > 1:
+        extra = f"  [+{max(0,distinct_remotes-1)} remotes, +{max(0,sockets-1)} sockets]"
+    return first_remote + extra
+
+# sort_key -> C-level key function for top-K selection
+SORT_KEYS = {"in": attrgetter("rin"), "out": attrgetter("rout"), "delta": attrgetter("rdelta")}
+
 def build_rows(group, prev_totals, curr_totals, curr_conns, dt_seconds):
     """
     Compute per-process rates and build rows.
     Each row has rin, rout, rsum, rdelta regardless of which is displayed.
     Rates are based on actual elapsed time dt_seconds.
+    prev_totals is just the previous sample's dict: the loops hand it over
+    by reference, so nothing is copied between ticks.
     """
     if dt_seconds <= 0:
         dt_seconds = 1e-6
 
     proc_rate = {}
-    for proc, (bin_now, bout_now) in curr_totals.items():
-        bin_prev, bout_prev = prev_totals.get(proc, (bin_now, bout_now))
-        din  = max(0, bin_now  - bin_prev)
-        dout = max(0, bout_now - bout_prev)
+    prev_get = prev_totals.get
+    for proc, now in curr_totals.items():
+        prev = prev_get(proc)
+        # new (no baseline yet) or idle process: no traffic this interval
+        if prev is None or prev == now: continue
+        din  = now[0] - prev[0]
+        dout = now[1] - prev[1]
+        if din < 0: din = 0
+        if dout < 0: dout = 0
         if din or dout:
             rin  = din  / dt_seconds
             rout = dout / dt_seconds
@@ -178,63 +399,54 @@ def build_rows(group, prev_totals, curr_totals, curr_conns, dt_seconds):
 
     rows = []
     if group == "remote":
-        grouped = {}
-        for proc, conns in curr_conns.items():
-            if proc not in proc_rate: continue
-            rin, rout, rsum, rdelta = proc_rate[proc]
-            for c in conns:
-                key = (proc, c["iface"], c["state"], c["remote"])
+        # one row per (proc, iface, state, remote); proc is fixed per inner
+        # loop, so each process groups on an (iface, state, remote) 3-tuple
+        for proc, (rin, rout, rsum, rdelta) in proc_rate.items():
+            grouped = {}
+            for c in curr_conns.get(proc, ()):
+                iface, state, remote = c["iface"], c["state"], c["remote"]
+                key = (iface, state, remote)
                 e = grouped.get(key)
-                if not e:
-                    grouped[key] = {
-                        "proc": proc, "iface": c["iface"], "state": c["state"],
-                        "remote": c["remote"], "locals": [c["local"]],
-                        "rin": rin, "rout": rout, "rsum": rsum, "rdelta": rdelta
-                    }
+                if e is None:
+                    grouped[key] = Row(proc, iface, state, rin, rout, rsum, rdelta,
+                                       remote=remote, locals=[c["local"]])
                 else:
-                    e["locals"].append(c["local"])
-        rows = list(grouped.values())
+                    e.locals.append(c["local"])
+            rows.extend(grouped.values())
     else:
         for proc, (rin, rout, rsum, rdelta) in proc_rate.items():
             conns = curr_conns.get(proc, [])
-            remotes = [c["remote"] for c in conns if c["remote"]]
-            sockets = len(conns)
-            distinct_remotes = len(set(remotes))
-            first_remote = remotes[0] if remotes else "(no remote)"
-            extra = ""
-            if distinct_remotes > 1 or sockets > 1:
-                extra = f"  [+{max(0,distinct_remotes-1)} remotes, +{max(0,sockets-1)} sockets]"
             primary_iface, extra_ifaces, state_for_primary = summarize_ifaces(conns)
             iface_disp = primary_iface if extra_ifaces <= 0 else f"{primary_iface} (+{extra_ifaces})"
-            rows.append({
-                "proc": proc, "iface": iface_disp, "state": state_for_primary,
-                "conn": first_remote + extra,
-                "rin": rin, "rout": rout, "rsum": rsum, "rdelta": rdelta
-            })
+            rows.append(Row(proc, iface_disp, state_for_primary, rin, rout, rsum, rdelta,
+                            conns=conns))
     return rows
 
 # =========================
 # curses UI
 # =========================
-def ui_loop(args, cmd):
-    import curses
-
+def ui_loop(args, nettop_args):
     # --- UI State ---
     display_metric = "delta"   # column shown: 'delta' or 'sum' (default delta)
     sort_key = "delta"         # 'in' | 'out' | 'delta' (default delta)
     show_help = True
 
-    # warm-up snapshot & time anchor
-    prev_totals, _ = parse_snapshot(cmd)
-    prev_time = time.monotonic()
+    # one long-lived nettop; its first sample is the time anchor
+    cmd = build_nettop_cmd(nettop_args, args.interval)
+    sampler = Sampler(cmd, args.interval)
+    prev_totals, prev_time = None, None
+
+    # header pieces that only change with the interval
+    title_fmt = title_template(args)
+    cmd_line = f" cmd: {' '.join(cmd)}"
 
     def header_lines(width):
         metric_label = "Δ = |IN-OUT|" if display_metric == "delta" else "SUM = IN+OUT"
         sort_name = {"in":"IN", "out":"OUT", "delta":"Δ = |IN-OUT|"}[sort_key]
         return [
-            f" nettop rates watch  [{datetime.now().isoformat(timespec='seconds')}]  interval={args.interval:.1f}s  group={args.group}  threshold={args.threshold:.1f} KB/s",
-            f" cmd: {' '.join(cmd)}",
-            f" keys: [h] help  [i] sort IN  [o] sort OUT  [d] sort Δ  [m] toggle column (Δ↔SUM)  [t] change interval  [q] quit",
+            title_fmt % timestamp(),
+            cmd_line,
+            " keys: [h] help  [i] sort IN  [o] sort OUT  [d] sort Δ  [m] toggle column (Δ↔SUM)  [t] change interval  [q] quit",
             f" column: {metric_label}   sorting by: {sort_name}"
         ]
 
@@ -266,53 +478,53 @@ def ui_loop(args, cmd):
         stdscr.attrset(normal_attr)
         return normal_attr, hilite_attr
 
+    # (text, attr) per screen row as of the last draw(); rows that come out
+    # identical next time are not rewritten. Reset (last_size=None) to force
+    # a full repaint, e.g. after something else wrote to the window.
+    last_frame = []
+    last_size = None
+
     def draw(stdscr, rows, normal_attr, hilite_attr):
-        stdscr.erase()
+        nonlocal last_frame, last_size
         maxy, maxx = stdscr.getmaxyx()
-
-        # hard fill
-        for y in range(maxy):
-            stdscr.addnstr(y, 0, " " * (maxx - 1), maxx - 1, normal_attr)
+        frame = []
 
         top = 0
         if show_help:
             for ln in header_lines(maxx):
-                stdscr.addnstr(top, 0, ln.ljust(maxx-1), maxx-1, normal_attr); top += 1
-            stdscr.addnstr(top, 0, ("-" * (maxx-1)), maxx-1, normal_attr); top += 1
+                frame.append((ln, normal_attr)); top += 1
+            frame.append(("-" * (maxx-1), normal_attr)); top += 1
 
         metric_hdr = "Δ KB/s" if display_metric == "delta" else "SUM KB/s"
-        hdr = (f"{'IN KB/s':>{NUMW}}  {'OUT KB/s':>{NUMW}}  "
-               f"{metric_hdr:>{NUMW}}   "
-               f"{'PROCESS':<30}  {'IFACE(S)':<12}  {'STATE':<12}  CONNECTION")
-        stdscr.addnstr(top, 0, hdr.ljust(maxx-1), maxx-1, normal_attr); top += 1
-        stdscr.addnstr(top, 0, ("-" * (maxx-1)), maxx-1, normal_attr); top += 1
+        frame.append((table_header(metric_hdr), normal_attr)); top += 1
+        frame.append(("-" * (maxx-1), normal_attr)); top += 1
 
         shown = 0
         thr_bytes = args.threshold * 1024.0
         for e in rows:
-            if shown >= args.top or top >= maxy-1: break
-            rin, rout = e["rin"], e["rout"]
-            metric_val = e["rdelta"] if display_metric=="delta" else e["rsum"]
-            proc = e["proc"]; iface = e.get("iface","-"); state = e.get("state","-")
-            if args.group == "remote":
-                locals_list = e.get("locals") or []
-                first_local = locals_list[0] if locals_list else None
-                extra = f" [+{len(locals_list)-1}]" if len(locals_list) > 1 else ""
-                conn_str = (first_local + "<->" if first_local else "") + e["remote"] + extra
-            else:
-                conn_str = e["conn"]
-
-            line = (
-                f"{kbs_num(rin):>{NUMW}}  {kbs_num(rout):>{NUMW}}  {kbs_num(metric_val):>{NUMW}}   "
-                f"{proc:<30}  {iface:<12}  {state:<12}  {conn_str}"
-            )
+            if top >= maxy-1: break
+            rin, rout = e.rin, e.rout
+            metric_val = e.rdelta if display_metric=="delta" else e.rsum
+            proc, iface, state = e.proc, e.iface, e.state
+            line = table_line(rin, rout, metric_val, proc, iface, state, format_conn(e))
 
             attr = hilite_attr if (thr_bytes > 0 and metric_val > thr_bytes) else normal_attr
-            stdscr.addnstr(top, 0, line.ljust(maxx-1), maxx-1, attr)
+            frame.append((line, attr))
             top += 1; shown += 1
 
         if shown == 0 and top < maxy:
-            stdscr.addnstr(top, 0, "(no process traffic this interval)".ljust(maxx-1), maxx-1, normal_attr)
+            frame.append(("(no process traffic this interval)", normal_attr))
+
+        if (maxy, maxx) != last_size:
+            stdscr.erase()   # blanks with the bkgd() attr from setup_colors
+            last_frame, last_size = [], (maxy, maxx)
+        rewrite, blank = frame_updates(frame, last_frame, maxy)
+        for y in rewrite:
+            text, attr = frame[y]
+            stdscr.addstr(y, 0, fit_cells(text, maxx-1), attr)
+        for y in blank:
+            stdscr.move(y, 0); stdscr.clrtoeol()
+        last_frame = frame
 
         stdscr.refresh()
 
@@ -324,6 +536,7 @@ def ui_loop(args, cmd):
             return "quit"
         if ch == -1:
             return None
+        if ch == curses.KEY_RESIZE: return "resize"
         c = chr(ch).lower() if 0 <= ch < 256 else None
         if c == 'q': return "quit"
         if c == 'h': return "help"
@@ -336,11 +549,12 @@ def ui_loop(args, cmd):
 
     def prompt_interval_blocking(stdscr, normal_attr):
         maxy, maxx = stdscr.getmaxyx()
-        prompt = "New interval (seconds, e.g., 0.5 or 2): "
+        prompt = "New interval (whole seconds, e.g., 1 or 5): "
         stdscr.addnstr(maxy-1, 0, " " * (maxx-1), maxx-1, normal_attr)
         stdscr.addnstr(maxy-1, 0, prompt, maxx-1, normal_attr)
-        try: import curses; curses.curs_set(1)
+        try: curses.curs_set(1)
         except Exception: pass
+        stdscr.leaveok(False)   # the typed input needs the real cursor
         curses.echo()
         stdscr.timeout(-1)
         try:
@@ -349,37 +563,50 @@ def ui_loop(args, cmd):
             s = ""
         finally:
             curses.noecho()
+            stdscr.leaveok(True)
             try: curses.curs_set(0)
             except Exception: pass
         return s
 
     def loop(stdscr):
-        nonlocal prev_totals, prev_time, display_metric, sort_key, show_help
+        nonlocal cmd, sampler, prev_totals, prev_time, display_metric, sort_key, show_help, last_size
+        nonlocal title_fmt, cmd_line
         normal_attr, hilite_attr = setup_colors(stdscr)
-        next_target = time.monotonic()
+        stdscr.leaveok(True)   # no cursor to keep in sync; saves cursor moves on refresh
+        rows = []
+        redraw = True
+        drawn_sec = None        # wall-clock second shown in the title line
+        last_key = -KEY_ACTIVE_S
 
         while True:
-            curr_totals, curr_conns = parse_snapshot(cmd)
-            now = time.monotonic()
-            dt = max(1e-6, now - prev_time)
-            rows = build_rows(args.group, prev_totals, curr_totals, curr_conns, dt)
-            prev_totals = curr_totals
-            prev_time = now
-
-            if sort_key == "in":
-                rows.sort(key=lambda e: e["rin"], reverse=True)
-            elif sort_key == "out":
-                rows.sort(key=lambda e: e["rout"], reverse=True)
+            try:
+                now, curr_totals, curr_conns = sampler.get(block=False)
+            except queue.Empty:
+                pass
             else:
-                rows.sort(key=lambda e: e["rdelta"], reverse=True)
-
-            draw(stdscr, rows, normal_attr, hilite_attr)
-
-            next_target += args.interval
-            remaining = max(0.0, next_target - time.monotonic())
-            ms = max(10, int(remaining * 1000))
-
-            action = poll_key(stdscr, ms)
+                if prev_totals is not None:
+                    dt = max(1e-6, now - prev_time)
+                    rows = build_rows(args.group, prev_totals, curr_totals, curr_conns, dt)
+                    redraw = True
+                prev_totals = curr_totals
+                prev_time = now
+
+            if show_help and int(time.time()) != drawn_sec:
+                redraw = True   # keep the title clock ticking between samples
+            if redraw:
+                top_rows = heapq.nlargest(args.top, rows, key=SORT_KEYS[sort_key])
+                draw(stdscr, top_rows, normal_attr, hilite_attr)
+                drawn_sec = int(time.time())
+                redraw = False
+
+            # keys stay responsive while the sampler thread waits on nettop;
+            # poll in short slices only while the user is actually typing
+            now = time.monotonic()
+            action = poll_key(stdscr, POLL_FAST_MS if now - last_key < KEY_ACTIVE_S else POLL_IDLE_MS)
+            if action is None: continue
+            redraw = True
+            if action == "resize": continue   # draw() repaints on the new size
+            last_key = time.monotonic()
             if action == "quit": break
             elif action == "help": show_help = not show_help
             elif action == "sort_in": sort_key = "in"
@@ -389,96 +616,104 @@ def ui_loop(args, cmd):
                 display_metric = "sum" if display_metric == "delta" else "delta"
             elif action == "change_interval":
                 s = prompt_interval_blocking(stdscr, normal_attr)
+                last_size = None   # the prompt line is not part of the frame
                 if s:
                     try:
-                        val = float(s)
-                        if val > 0:
+                        val = effective_interval(nettop_args, _interval_arg(s))
+                        if val != args.interval:
                             args.interval = val
-                    except ValueError:
+                            # nettop's own delay follows the interval: restart the stream
+                            sampler.close()
+                            cmd = build_nettop_cmd(nettop_args, args.interval)
+                            sampler = Sampler(cmd, args.interval)
+                            prev_totals, prev_time = None, None
+                            title_fmt = title_template(args)
+                            cmd_line = f" cmd: {' '.join(cmd)}"
+                    except argparse.ArgumentTypeError:
                         pass
-                next_target = time.monotonic()
 
-    import curses
-    curses.wrapper(loop)
+    try:
+        curses.wrapper(loop)
+    finally:
+        sampler.close()
 
 # =========================
 # non-UI fallback (stdout)
 # =========================
-def non_ui_loop(args, cmd):
-    prev_totals, _ = parse_snapshot(cmd)
-    prev_time = time.monotonic()
+def non_ui_loop(args, nettop_args):
+    cmd = build_nettop_cmd(nettop_args, args.interval)
+    sampler = Sampler(cmd, args.interval)
+
+    title_fmt = title_template(args)
+    cmd_line = f" cmd: {' '.join(cmd)}"
 
     display_metric = "delta"
     sort_key = "delta"
     thr_bytes = args.threshold * 1024.0
 
+    def next_sample():
+        # say so, rather than sit on a blank screen, while nettop stays silent
+        while True:
+            try:
+                return sampler.get(timeout=2 * args.interval)
+            except queue.Empty:
+                print(f"(no sample from nettop for {2 * args.interval:g}s; still waiting)")
+
     try:
-        next_target = time.monotonic()
+        prev_time, prev_totals, _ = next_sample()
         while True:
-            curr_totals, curr_conns = parse_snapshot(cmd)
-            now = time.monotonic()
+            now, curr_totals, curr_conns = next_sample()
             dt = max(1e-6, now - prev_time)
             rows = build_rows(args.group, prev_totals, curr_totals, curr_conns, dt)
             prev_totals = curr_totals
             prev_time = now
 
-            if sort_key == "in":
-                rows.sort(key=lambda e: e["rin"], reverse=True)
-            elif sort_key == "out":
-                rows.sort(key=lambda e: e["rout"], reverse=True)
-            else:
-                rows.sort(key=lambda e: e["rdelta"], reverse=True)
+            rows = heapq.nlargest(args.top, rows, key=SORT_KEYS[sort_key])
 
             clear()
             width = shutil.get_terminal_size((150, 26)).columns
             line = "-" * width
             print(line)
-            print(f" nettop rates watch  [{datetime.now().isoformat(timespec='seconds')}]  interval={args.interval:.1f}s  group={args.group}  threshold={args.threshold:.1f} KB/s")
-            print(f" cmd: {' '.join(cmd)}")
+            print(title_fmt % timestamp())
+            print(cmd_line)
             print(" (non-UI fallback) Run in a real TTY for interactive keys: h i o d m t q")
             print(line)
 
             metric_hdr = "Δ KB/s" if display_metric == "delta" else "SUM KB/s"
-            print(f"{'IN KB/s':>{NUMW}}  {'OUT KB/s':>{NUMW}}  {metric_hdr:>{NUMW}}   "
-                  f"{'PROCESS':<30}  {'IFACE(S)':<12}  {'STATE':<12}  CONNECTION")
+            print(table_header(metric_hdr))
             print(line)
 
             shown = 0
             for e in rows:
-                if shown >= args.top: break
-                rin, rout = e["rin"], e["rout"]
-                metric_val = e["rdelta"] if display_metric=="delta" else e["rsum"]
-                proc, iface, state = e["proc"], e.get("iface","-"), e.get("state","-")
-                if args.group == "remote":
-                    locals_list = e.get("locals") or []
-                    first_local = locals_list[0] if locals_list else None
-                    extra = f" [+{len(locals_list)-1}]" if len(locals_list) > 1 else ""
-                    conn_str = (first_local + "<->" if first_local else "") + e["remote"] + extra
-                else:
-                    conn_str = e["conn"]
-
+                rin, rout = e.rin, e.rout
+                metric_val = e.rdelta if display_metric=="delta" else e.rsum
+                proc, iface, state = e.proc, e.iface, e.state
                 use_hilite = (args.threshold > 0 and metric_val > thr_bytes)
                 prefix = HILITE if use_hilite else ""
                 suffix = RESET if use_hilite else ""
-                line_str = (
-                    f"{kbs_num(rin):>{NUMW}}  {kbs_num(rout):>{NUMW}}  {kbs_num(metric_val):>{NUMW}}   "
-                    f"{proc:<30}  {iface:<12}  {state:<12}  {conn_str}"
-                )
+                line_str = table_line(rin, rout, metric_val, proc, iface, state, format_conn(e))
                 print(prefix + line_str + suffix)
                 shown += 1
 
             if shown == 0:
                 print("(no process traffic this interval)")
-
-            next_target += args.interval
-            remaining = max(0.0, next_target - time.monotonic())
-            time.sleep(remaining)
     except KeyboardInterrupt:
         print("\nExiting.")
+    finally:
+        sampler.close()
 
 # =========================
 # main
 # =========================
+def _interval_arg(s):
+    try:
+        val = float(s)
+    except ValueError:
+        val = math.nan
+    if not (0 < val < math.inf):
+        raise argparse.ArgumentTypeError(f"invalid interval: {s!r} (want a positive number of seconds)")
+    return val
+
 def main(argv=None):
     _ensure_macos_or_exit()
 
@@ -487,7 +722,8 @@ def main(argv=None):
         description="Watch nettop rates (bytes/sec per process) with connection listing & grouping."
     )
     ap.add_argument("-V","--version", action="version", version=f"nettop-notch {__version__}")
-    ap.add_argument("-i","--interval", type=float, default=DEFAULT_INTERVAL, help=f"Sampling interval seconds (default {DEFAULT_INTERVAL})")
+    ap.add_argument("-i","--interval", type=_interval_arg, default=DEFAULT_INTERVAL,
+                    help=f"Sampling interval in whole seconds, rounded up (default {DEFAULT_INTERVAL:g})")
     ap.add_argument("-t","--top", type=int, default=DEFAULT_TOP, help=f"Top rows to show (default {DEFAULT_TOP})")
     ap.add_argument("-g","--group", choices=["remote","process"], default="process",
                     help='Grouping: "remote" = per (proc,iface,state,remote); "process" = one line per process')
@@ -502,17 +738,18 @@ def main(argv=None):
     nettop_args = args.nettop_args
     if nettop_args and nettop_args[0] == "--":
         nettop_args = nettop_args[1:]
-    cmd = build_nettop_cmd(nettop_args)
+    # what nettop will really do: whole seconds, or the user's own -s
+    args.interval = effective_interval(nettop_args, args.interval)
 
-    use_ui = sys.stdin.isatty() and sys.stdout.isatty() and os.environ.get("TERM")
+    use_ui = curses is not None and sys.stdin.isatty() and sys.stdout.isatty() and os.environ.get("TERM")
     if use_ui:
         try:
-            ui_loop(args, cmd)
+            ui_loop(args, nettop_args)
             return 0
         except Exception as e:
             print(f"(UI disabled: {e})", file=sys.stderr)
 
-    non_ui_loop(args, cmd)
+    non_ui_loop(args, nettop_args)
     return 0
 
 if __name__ == "__main__":
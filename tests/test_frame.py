@@ -0,0 +1,59 @@
+from nettop_notch.cli import fit_cells, frame_updates
+
+N, H = 0, 1   # stand-ins for the curses attrs
+
+
+def test_first_frame_writes_every_row():
+    frame = [("a", N), ("b", N)]
+    assert frame_updates(frame, [], 24) == ([0, 1], [])
+
+
+def test_unchanged_rows_are_skipped():
+    last = [("hdr", N), ("a.1", N), ("b.2", H)]
+    frame = [("hdr", N), ("a.1 changed", N), ("b.2", H)]
+    assert frame_updates(frame, last, 24) == ([1], [])
+
+
+def test_attr_change_rewrites_row():
+    last = [("a.1", N)]
+    assert frame_updates([("a.1", H)], last, 24) == ([0], [])
+
+
+def test_wide_row_also_rewrites_the_row_below():
+    last = [("hdr", N), ("WeChat.1", N), ("b.2", N), ("c.3", N)]
+    frame = [("hdr", N), ("微信微信微信.1", N), ("b.2", N), ("c.3", N)]
+    # b.2 is unchanged, but the wide row above may have wrapped into it
+    assert frame_updates(frame, last, 24) == ([1, 2], [])
+
+
+def test_wide_rows_chain():
+    last = [("x", N), ("微信.1", N), ("微信.2", N), ("c.3", N)]
+    frame = [("y", N), ("微信.1", N), ("微信.2", N), ("c.3", N)]
+    assert frame_updates(frame, last, 24) == ([0], [])
+    frame = [("微信", N), ("微信.1", N), ("微信.2", N), ("c.3", N)]
+    assert frame_updates(frame, last, 24) == ([0, 1, 2, 3], [])
+
+
+def test_shorter_frame_clears_leftover_rows():
+    last = [("hdr", N), ("a.1", N), ("b.2", N), ("c.3", N)]
+    frame = [("hdr", N), ("a.1", N)]
+    assert frame_updates(frame, last, 24) == ([], [2, 3])
+
+
+def test_wide_last_row_clears_the_row_below():
+    frame = [("hdr", N), ("微信.1", N)]
+    assert frame_updates(frame, [], 24) == ([0, 1], [2])
+    assert frame_updates(frame, [], 2) == ([0, 1], [])
+
+
+def test_fit_cells_ascii():
+    assert fit_cells("abc", 5) == "abc  "
+    assert fit_cells("abcdef", 4) == "abcd"
+
+
+def test_fit_cells_counts_wide_characters_as_two():
+    assert fit_cells("微信.1", 8) == "微信.1  "
+    # a wide character that would straddle the edge is dropped, not split
+    assert fit_cells("a微信", 4) == "a微 "
+    assert fit_cells("é", 2) == "é "
+    assert fit_cells("éx", 3) == "éx "
@@ -0,0 +1,44 @@
+import argparse
+
+import pytest
+
+from nettop_notch.cli import _interval_arg, build_nettop_cmd, effective_interval
+
+
+@pytest.mark.parametrize("interval, expected", [(0.5, 1), (1.0, 1), (2.1, 3), (3.0, 3)])
+def test_effective_interval_rounds_up_to_whole_seconds(interval, expected):
+    assert effective_interval([], interval) == expected
+
+
+def test_effective_interval_user_s_wins():
+    assert effective_interval(["-t", "wifi", "-s", "5"], 0.5) == 5
+
+
+@pytest.mark.parametrize("nettop_args", [["-s"], ["-s", "fast"], ["-s", "1.5"]])
+def test_effective_interval_malformed_s_falls_back(nettop_args):
+    assert effective_interval(nettop_args, 2.1) == 3
+
+
+def test_build_nettop_cmd_defaults():
+    assert build_nettop_cmd([], 2.1) == ["nettop", "-n", "-x", "-L", "0", "-s", "3"]
+
+
+def test_build_nettop_cmd_keeps_user_flags():
+    cmd = build_nettop_cmd(["-L", "5", "-s", "2", "-x"], 3.0)
+    assert cmd == ["nettop", "-L", "5", "-s", "2", "-x", "-n"]
+
+
+def test_build_nettop_cmd_user_l_only():
+    cmd = build_nettop_cmd(["-l", "1"], 0.5)
+    assert "-L" not in cmd
+    assert cmd[-2:] == ["-s", "1"]
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "nan", "inf", "abc"])
+def test_interval_arg_rejects(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        _interval_arg(value)
+
+
+def test_interval_arg_accepts_fractions():
+    assert _interval_arg("0.5") == 0.5
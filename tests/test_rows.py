@@ -0,0 +1,82 @@
+from nettop_notch.cli import build_rows, format_conn, parse_snapshot, summarize_ifaces
+
+HEADER = "time,,interface,state,bytes_in,bytes_out"
+
+
+def conn(iface, state, local, remote):
+    return {"iface": iface, "state": state, "local": local, "remote": remote}
+
+
+def test_parse_short_rows_and_missing_bytes_in():
+    totals, conns = parse_snapshot([
+        "time,,interface,state,bytes_out",
+        "t,a.1,,,20",
+        "t,b.2",
+        "t,tcp4 1.1.1.1:1<->2.2.2.2:443,en0",
+    ])
+    assert totals == {"a.1": (0, 20), "b.2": (0, 0)}
+    assert conns == {"a.1": [], "b.2": [conn("en0", "-", "tcp4 1.1.1.1:1", "2.2.2.2:443")]}
+
+
+def test_parse_non_decimal_counters_read_as_zero():
+    totals, _ = parse_snapshot([HEADER, "t,a.1,,,12²,7"])
+    assert totals == {"a.1": (0, 7)}
+
+
+def test_parse_conn_rows_before_any_process_are_dropped():
+    totals, conns = parse_snapshot([
+        HEADER,
+        "t,tcp4 1.1.1.1:1<->2.2.2.2:443,en0,Established,1,1",
+        "t,a.1,,,10,20",
+        "t,udp4 *:5353<->*:*,en0,,1,1",
+    ])
+    assert totals == {"a.1": (10, 20)}
+    assert conns == {"a.1": [conn("en0", "-", "udp4 *:5353", "*:*")]}
+
+
+def test_summarize_ifaces_prefers_real_external_interface():
+    conns = [
+        conn("-", "Listen", "", ""),
+        conn("lo0", "Established", "", ""),
+        conn("en0", "SynSent", "", ""),
+        conn("en0", "Established", "", ""),
+    ]
+    # lo0 and en0 are real, '-' is not; state is the first one seen on en0
+    assert summarize_ifaces(conns) == ("en0", 1, "SynSent")
+    assert summarize_ifaces([conn("-", "Listen", "", ""), conn("lo0", "Closed", "", "")]) == ("lo0", 0, "Closed")
+    assert summarize_ifaces([]) == ("-", 0, "-")
+
+
+def test_remote_grouping_folds_locals():
+    prev = {"a.1": (0, 0)}
+    curr = {"a.1": (2048, 1024)}
+    conns = {"a.1": [
+        conn("en0", "Established", "tcp4 10.0.0.2:5000", "1.2.3.4:443"),
+        conn("en0", "Established", "tcp4 10.0.0.2:5001", "1.2.3.4:443"),
+        conn("en0", "Established", "tcp4 10.0.0.2:5002", "1.2.3.4:443"),
+        conn("utun4", "Established", "tcp4 10.8.0.2:6000", "5.6.7.8:22"),
+    ]}
+    rows = build_rows("remote", prev, curr, conns, 2.0)
+    assert [(r.iface, r.rin, r.rout) for r in rows] == [("en0", 1024.0, 512.0), ("utun4", 1024.0, 512.0)]
+    assert [format_conn(r) for r in rows] == [
+        "tcp4 10.0.0.2:5000<->1.2.3.4:443 [+2]",
+        "tcp4 10.8.0.2:6000<->5.6.7.8:22",
+    ]
+
+
+def test_process_rows_connection_suffix():
+    # idle.2 did not move and new.3 has no baseline yet: neither gets a row
+    prev = {"a.1": (0, 0), "idle.2": (5, 5)}
+    curr = {"a.1": (1000, 3000), "idle.2": (5, 5), "new.3": (9, 9)}
+    conns = {"a.1": [
+        conn("en0", "Established", "l1", "1.2.3.4:443"),
+        conn("en0", "Established", "l2", "1.2.3.4:443"),
+        conn("en0", "Established", "l3", "5.6.7.8:80"),
+    ], "idle.2": [], "new.3": []}
+    rows = build_rows("process", prev, curr, conns, 1.0)
+    assert len(rows) == 1
+    row = rows[0]
+    assert (row.proc, row.iface, row.state) == ("a.1", "en0", "Established")
+    assert (row.rsum, row.rdelta) == (4000.0, 2000.0)
+    assert format_conn(row) == "1.2.3.4:443  [+1 remotes, +2 sockets]"
+    assert format_conn(row._replace(conns=[])) == "(no remote)"
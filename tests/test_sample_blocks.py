@@ -0,0 +1,92 @@
+import os
+import threading
+import time
+
+from nettop_notch.cli import sample_blocks
+
+HEADER = "time,,interface,state,bytes_in,bytes_out"
+
+
+def feed(pieces):
+    """
+    Returns a pipe's read end; a thread writes `pieces` into it, where a
+    float is a pause in seconds and a str is written as-is. The write end
+    is closed after the last piece.
+    """
+    r, w = os.pipe()
+
+    def writer():
+        try:
+            for p in pieces:
+                if isinstance(p, float):
+                    time.sleep(p)
+                else:
+                    os.write(w, p.encode("utf-8"))
+        finally:
+            os.close(w)
+
+    threading.Thread(target=writer, daemon=True).start()
+    return r
+
+
+def blocks(pieces, **kw):
+    r = feed(pieces)
+    try:
+        return list(sample_blocks(r, **kw))
+    finally:
+        os.close(r)
+
+
+def test_splits_on_repeated_header():
+    out = blocks([
+        HEADER + "\na.1,,,,10,20\n",
+        HEADER + "\nb.2,,,,30,40\nc.3,,,,5,6\n",
+    ])
+    assert out == [
+        [HEADER, "a.1,,,,10,20"],
+        [HEADER, "b.2,,,,30,40", "c.3,,,,5,6"],
+    ]
+
+
+def test_chunk_boundaries_inside_lines():
+    out = blocks([HEADER[:5], 0.05, HEADER[5:] + "\na.1,,,,1", 0.05, ",2\n" + HEADER + "\n"])
+    assert out == [[HEADER, "a.1,,,,1,2"]]
+
+
+def test_stall_shorter_than_idle_does_not_split():
+    # a process row, a pause well past SAMPLE_POLL, then its connection row
+    r = feed([
+        HEADER + "\na.1,,,,10,20\n", 0.4,
+        "tcp4 1.2.3.4:5<->6.7.8.9:443,en0,Established,,\n", 1.0,
+        HEADER + "\nb.2,,,,1,1\n",
+    ])
+    try:
+        gen = sample_blocks(r, idle=0.8)
+        first = next(gen)
+        assert first == [HEADER, "a.1,,,,10,20", "tcp4 1.2.3.4:5<->6.7.8.9:443,en0,Established,,"]
+        assert list(gen) == [[HEADER, "b.2,,,,1,1"]]
+    finally:
+        os.close(r)
+
+
+def test_idle_ends_sample_before_next_header():
+    r = feed([HEADER + "\na.1,,,,10,20\n", 2.0])
+    try:
+        started = time.monotonic()
+        first = next(sample_blocks(r, idle=0.3))
+        assert first == [HEADER, "a.1,,,,10,20"]
+        assert time.monotonic() - started < 1.5
+    finally:
+        os.close(r)
+
+
+def test_stop_returns_while_pipe_is_open():
+    stop = threading.Event()
+    r, w = os.pipe()
+    try:
+        os.write(w, (HEADER + "\na.1,,,,10,20\n").encode("utf-8"))
+        stop.set()
+        assert list(sample_blocks(r, stop)) == []
+    finally:
+        os.close(r)
+        os.close(w)